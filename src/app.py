@@ -4,6 +4,7 @@ Main TABMON Dashboard Application
 
 from pathlib import Path
 
+import pandas as pd
 import streamlit as st
 
 from audio_dashboard import show_audio_dashboard
@@ -11,6 +12,9 @@ from config.settings import APP_TITLE
 from map_dashboard import app as map_app
 from site_dashboard import show_site_dashboard
 
+# Filtered frames share memory with the cached data until they are modified
+pd.set_option("mode.copy_on_write", True)
+
 
 def main():
     """Main application entry point."""
@@ -11,6 +11,7 @@ from components.audio import (
     render_site_selection,
 )
 from components.sidebar import render_complete_sidebar
+from components.site_components import get_site_record
 from components.ui_styles import load_custom_css, render_info_section_header
 from services.audio_service import AudioService
 from services.data_service import DataService
@@ -31,6 +32,8 @@ def show_audio_dashboard() -> None:
     # Load site information and device data for metrics
     with st.spinner("🔄 Loading site and device information..."):
         site_info = data_service.load_site_info()
+        site_records = data_service.load_site_records()
+        countries, sites_by_country = data_service.load_site_options()
         device_data = data_service.load_device_status()
 
     # Calculate metrics for the sidebar
@@ -48,20 +51,17 @@ def show_audio_dashboard() -> None:
     col1, col2 = st.columns(2)
 
     with col1:
-        selected_country, selected_site, filtered_site_info = render_site_selection(
-            site_info
+        selected_country, selected_site = render_site_selection(
+            countries, sites_by_country
         )
 
-    # Get site data
-    site_data = filtered_site_info[filtered_site_info["Site"] == selected_site]
+    # Get the first record for the site
+    record = get_site_record(site_records, selected_country, selected_site)
 
-    if site_data.empty:
+    if record is None:
         st.error(f"❌ No data found for site: {selected_site}")
         return
 
-    # Get the first record for the site
-    record = site_data.iloc[0]
-
     # Page header
     st.markdown("---")
     render_info_section_header(
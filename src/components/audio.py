@@ -9,26 +9,23 @@ import streamlit as st
 from components.ui_styles import render_info_section_header
 
 
-def render_site_selection(site_info: pd.DataFrame) -> tuple:
+def render_site_selection(countries: list, sites_by_country: dict) -> tuple:
     """Render country and site selection interface."""
     st.markdown("### 🌍 Site Selection")
 
     # Country filter
-    countries = site_info["Country"].dropna().unique().tolist()
     selected_country = st.selectbox(
-        "📍 Select Country", sorted(countries), key="audio_country_filter"
+        "📍 Select Country", countries, key="audio_country_filter"
     )
 
-    # Filter by country
-    filtered_site_info = site_info[site_info["Country"] == selected_country]
-
     # Site filter
-    sites = filtered_site_info["Site"].dropna().unique().tolist()
     selected_site = st.selectbox(
-        "🏞️ Select Site", sorted(sites), key="audio_site_filter"
+        "🏞️ Select Site",
+        sites_by_country.get(selected_country, []),
+        key="audio_site_filter",
     )
 
-    return selected_country, selected_site, filtered_site_info
+    return selected_country, selected_site
 
 
 def render_site_details(record: pd.Series) -> None:
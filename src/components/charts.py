@@ -69,7 +69,7 @@ def render_country_bar_chart(status_df: pd.DataFrame):
 
     # Aggregate data by country
     country_stats = (
-        status_df.groupby("Country")
+        status_df.groupby("Country", observed=True)
         .agg({"status": lambda x: [(x == "Online").sum(), (x == "Offline").sum()]})
         .reset_index()
     )
@@ -2,45 +2,287 @@
 
 from datetime import date, datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from components.ui_styles import render_info_section_header
+from config.settings import MAX_FILTER_OPTIONS, MAX_MULTISELECT_OPTIONS
+from utils.data_loader import scope_key_codes
+
+# Maximum number of masks and results kept in a session's filter cache
+MAX_CACHED_FILTERS = 64
+
+# Start of the recording history, used as the default start date. Filter
+# dates are naive UTC, like the parsed last_file column.
+_HISTORY_START_DATE = pd.Timestamp(date(2020, 1, 1))
+
+# Offset from midnight to the last second of the day, for inclusive end dates
+_END_OF_DAY = pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+
+# Quick filter presets; None means "no filter" and days limits the date range
+_PRESET_SPECS = {
+    "🌟 All Devices": {
+        "countries": None,
+        "statuses": None,
+        "days": None,
+        "description": "Show all devices without any filters",
+    },
+    "✅ Online Devices Only": {
+        "countries": None,
+        "statuses": ["Online"],
+        "days": None,
+        "description": "Show only devices that are currently online",
+    },
+    "❌ Offline Devices Only": {
+        "countries": None,
+        "statuses": ["Offline"],
+        "days": None,
+        "description": "Show only devices that are currently offline",
+    },
+    "📅 Recent Activity (Last 30 days)": {
+        "countries": None,
+        "statuses": None,
+        "days": 30,
+        "description": "Show devices with activity in the last 30 days",
+    },
+    "🇳🇴 Norway Only": {
+        "countries": ["Norway"],
+        "statuses": None,
+        "days": None,
+        "description": "Show only devices deployed in Norway",
+    },
+    "🇳🇱 Netherlands Only": {
+        "countries": ["Netherlands"],
+        "statuses": None,
+        "days": None,
+        "description": "Show only devices deployed in the Netherlands",
+    },
+    "🇫🇷 France Only": {
+        "countries": ["France"],
+        "statuses": None,
+        "days": None,
+        "description": "Show only devices deployed in France",
+    },
+    "🇪🇸 Spain Only": {
+        "countries": ["Spain"],
+        "statuses": None,
+        "days": None,
+        "description": "Show only devices deployed in Spain",
+    },
+}
+
+
+def _sorted_unique(values: pd.Series) -> list:
+    """Get the sorted unique non-null values of a column."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Categories are already sorted; keep only those that occur
+        codes = np.unique(values.cat.codes.to_numpy())
+        return values.cat.categories[codes[codes >= 0]].tolist()
+    return np.sort(pd.unique(values.dropna().to_numpy())).tolist()
+
+
+def _float_array(values: pd.Series) -> np.ndarray:
+    """Get a numeric column as a float64 array with NaN for missing values."""
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _column_range(values: pd.Series) -> tuple[float, float] | None:
+    """Get the (min, max) of the finite values of a column, if there are any."""
+    array = _float_array(values)
+    array = np.where(np.isfinite(array), array, np.nan)
+    if np.isnan(array).all():
+        return None
+    return float(np.nanmin(array)), float(np.nanmax(array))
+
+
+def _isin_mask(column: pd.Series, values: frozenset) -> np.ndarray:
+    """Get a boolean mask of the rows whose value is in the given set."""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        # Mark the wanted codes in a lookup table and gather it per row; the
+        # extra last slot is indexed by missing values (-1) and stays False
+        categories = column.cat.categories
+        codes = categories.get_indexer(list(values))
+        selected = np.zeros(len(categories) + 1, dtype=bool)
+        selected[codes[codes >= 0]] = True
+        return selected[column.cat.codes.to_numpy()]
+    return column.isin(values).to_numpy()
+
+
+def _filter_cache(data: pd.DataFrame) -> dict:
+    """Get this session's cache of filter masks and results for the data."""
+    cache = st.session_state.get("_filter_cache")
+    # Cached entries are only valid for the exact frame they were computed on
+    if cache is None or cache["data"] is not data:
+        cache = {"data": data, "entries": {}}
+        st.session_state["_filter_cache"] = cache
+    elif len(cache["entries"]) > MAX_CACHED_FILTERS:
+        cache["entries"].clear()
+    return cache["entries"]
+
+
+def _freeze(value):
+    """Turn a filter value into a hashable cache key component."""
+    if isinstance(value, list):
+        return frozenset(value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def _memoized_apply_filters(data: pd.DataFrame, **filters) -> pd.DataFrame:
+    """Apply filters, reusing the session's result for identical settings."""
+    results = _filter_cache(data)
+    key = ("_result", _freeze(filters))
+    if key not in results:
+        results[key] = apply_filters(data, **filters)
+    return results[key]
+
+
+def _selection_mask(data: pd.DataFrame, column: str, values: list) -> np.ndarray:
+    """Get the (cached) mask of rows whose column value is selected."""
+    masks = _filter_cache(data)
+    selected = frozenset(values)
+    key = (column, selected)
+    if key not in masks:
+        masks[key] = _isin_mask(data[column], selected)
+    return masks[key]
+
+
+def _scope_mask(data: pd.DataFrame, selections: dict) -> np.ndarray:
+    """Get the (cached) mask of rows matching all scope column selections."""
+    masks = _filter_cache(data)
+    key = ("_scope", *(frozenset(values or ()) for values in selections.values()))
+    if key not in masks:
+        valid_scope = scope_key_codes(data, selections)
+        masks[key] = np.isin(data["_scope"].to_numpy(), valid_scope)
+    return masks[key]
+
+
+def _column_options(data: pd.DataFrame, column: str) -> list:
+    """Get the sorted filter options of a column, cached for the data."""
+    options = _filter_cache(data)
+    key = ("_options", column)
+    if key not in options:
+        options[key] = _sorted_unique(data[column])
+    return options[key]
+
+
+def _date_order(data: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, int]:
+    """Get the sort order of last_file, the sorted dates and the valid count."""
+    cache = _filter_cache(data)
+    if "_date_order" not in cache:
+        column = data["last_file"]
+        # Frames from the loader are already naive UTC; only parse other inputs
+        if not pd.api.types.is_datetime64_dtype(column):
+            column = pd.to_datetime(column, errors="coerce", utc=True)
+            column = column.dt.tz_convert(None)
+        dates = column.to_numpy(dtype="datetime64[ns]")
+        # NaT sorts to the end, so the valid dates form a sorted prefix. They
+        # are kept as int64 nanoseconds so lookups are plain integer compares.
+        order = np.argsort(dates, kind="stable")
+        sorted_dates = dates[order].view(np.int64)
+        valid = len(dates) - int(np.isnat(dates).sum())
+        cache["_date_order"] = (order, sorted_dates, valid)
+    return cache["_date_order"]
+
+
+def _date_mask(data: pd.DataFrame, start: int, end: int) -> np.ndarray:
+    """Get a mask of rows with last_file in [start, end] ns or missing."""
+    order, sorted_dates, valid = _date_order(data)
+    lo = np.searchsorted(sorted_dates[:valid], start, side="left")
+    hi = np.searchsorted(sorted_dates[:valid], end, side="right")
+
+    mask = np.zeros(len(data), dtype=bool)
+    mask[order[lo:hi]] = True
+    mask[order[valid:]] = True
+    return mask
+
+
+def _active_selection(data: pd.DataFrame, column: str, values: list | None):
+    """Get the selection to filter on, or None if it keeps every value."""
+    if not values or column not in data.columns:
+        return None
+
+    if isinstance(data[column].dtype, pd.CategoricalDtype):
+        options = data[column].cat.categories
+    else:
+        options = _column_options(data, column)
+
+    # Selecting every option is the same as not filtering at all
+    return None if set(values).issuperset(options) else values
+
+
+def _selection_or_none(selected: list, options: list) -> list | None:
+    """Get the selection, or None if it is empty or covers every option."""
+    if not selected or set(selected).issuperset(options):
+        return None
+    return selected
+
+
+def _render_option_filter(
+    label: str, options: list, key: str, help_text: str, placeholder: str
+) -> list | None:
+    """Render a multiselect, or a text search when there are too many options."""
+    if len(options) <= MAX_MULTISELECT_OPTIONS:
+        selected = st.multiselect(
+            f"{label} (empty = All)",
+            options=options,
+            default=[],
+            placeholder=placeholder,
+            key=key,
+            help=help_text,
+        )
+        return _selection_or_none(selected, options)
+
+    query = st.text_input(
+        f"{label} (search, empty = All)",
+        key=f"{key}_search",
+        help=help_text,
+        placeholder=placeholder,
+    ).strip()
+    if not query:
+        return None
+
+    matches = [option for option in options if query.lower() in str(option).lower()]
+    # Keep the query when nothing matches so no devices are shown
+    return _selection_or_none(matches, options) if matches else [query]
 
 
 def render_country_filter(
     data: pd.DataFrame, column_name: str = "Country", key_prefix: str = "main"
-) -> list[str]:
+) -> list[str] | None:
     """Render a multi-select filter for countries."""
     if column_name not in data.columns:
-        return []
+        return None
 
-    countries = sorted(data[column_name].dropna().unique())
+    countries = _column_options(data, column_name)
 
-    selected_countries = st.multiselect(
+    selected_countries = _render_option_filter(
         "🌍 **Select Countries**",
-        options=countries,
-        default=countries,
+        countries,
         key=f"country_filter_{key_prefix}",
-        help="Filter devices by country",
+        help_text="Filter devices by country",
+        placeholder="All countries",
     )
 
     return selected_countries
 
 
-def render_status_filter(key_prefix: str = "main") -> list[str]:
+def render_status_filter(key_prefix: str = "main") -> list[str] | None:
     """Render a filter for device status."""
     status_options = ["Online", "Offline"]
 
     selected_statuses = st.multiselect(
-        "📊 **Select Status**",
+        "📊 **Select Status** (empty = All)",
         options=status_options,
-        default=status_options,
+        default=[],
+        placeholder="All statuses",
         key=f"status_filter_{key_prefix}",
         help="Filter devices by online/offline status",
     )
 
-    return selected_statuses
+    return _selection_or_none(selected_statuses, status_options)
 
 
 def render_date_range_filter(
@@ -51,18 +293,19 @@ def render_date_range_filter(
         # Return default range if no date column
         end_date = datetime.now().date()
         start_date = date(2020, 1, 1)  # Include all historical data
-        return pd.Timestamp(start_date, tz="UTC"), pd.Timestamp(end_date, tz="UTC")
+        # The end date is inclusive, so it is returned as the end of that day
+        return pd.Timestamp(start_date), pd.Timestamp(end_date) + _END_OF_DAY
 
-    # Get date range from data for determining max date only
-    dates = pd.to_datetime(data["last_file"], errors="coerce").dropna()
+    # The latest date is the last valid entry of the cached sort order
+    _, sorted_dates, valid = _date_order(data)
 
     # Start date to include all historical data
     start_date = date(2020, 1, 1)
 
-    if dates.empty:
+    if valid == 0:
         end_date = datetime.now().date()
     else:
-        max_date = dates.max().date()
+        max_date = pd.Timestamp(sorted_dates[valid - 1]).date()
         # Use current date if data max date is in the future
         end_date = min(max_date, datetime.now().date())
 
@@ -88,60 +331,68 @@ def render_date_range_filter(
             help="End date for filtering",
         )
 
-    return pd.Timestamp(start_date, tz="UTC"), pd.Timestamp(end_date, tz="UTC")
+    return pd.Timestamp(start_date), pd.Timestamp(end_date) + _END_OF_DAY
 
 
 def render_site_filter(
     data: pd.DataFrame, column_name: str = "site_name", key_prefix: str = "main"
-) -> list[str]:
+) -> list[str] | None:
     """Render a filter for research sites."""
     if column_name not in data.columns:
-        return []
+        return None
 
-    sites = sorted(data[column_name].dropna().unique())
+    sites = _column_options(data, column_name)
 
     if len(sites) > 10:
-        # For many sites, use a searchable selectbox
+        # For many sites, search first and only list the best matches
+        query = st.text_input(
+            "🔎 Search sites",
+            key=f"site_search_{key_prefix}",
+            help="Type part of a site name to narrow down the list",
+        ).lower()
+        matches = [site for site in sites if query in str(site).lower()]
+
         selected_site = st.selectbox(
             "🏞️ **Select Site** (All sites selected by default)",
-            options=["All"] + sites,
+            options=["All"] + matches[:MAX_FILTER_OPTIONS],
             index=0,
             key=f"site_filter_single_{key_prefix}",
             help="Select a specific site to focus on",
         )
 
         if selected_site == "All":
-            return sites
+            return None
         else:
             return [selected_site]
     else:
         # For fewer sites, use multiselect
         selected_sites = st.multiselect(
-            "🏞️ **Select Sites**",
+            "🏞️ **Select Sites** (empty = All)",
             options=sites,
-            default=sites,
+            default=[],
+            placeholder="All sites",
             key=f"site_filter_multi_{key_prefix}",
             help="Filter devices by research site",
         )
 
-        return selected_sites
+        return _selection_or_none(selected_sites, sites)
 
 
 def render_device_type_filter(
     data: pd.DataFrame, column_name: str = "device_type", key_prefix: str = "main"
-) -> list[str]:
+) -> list[str] | None:
     """Render a filter for device types."""
     if column_name not in data.columns:
-        return []
+        return None
 
-    device_types = sorted(data[column_name].dropna().unique())
+    device_types = _column_options(data, column_name)
 
-    selected_types = st.multiselect(
+    selected_types = _render_option_filter(
         "🔧 **Select Device Types**",
-        options=device_types,
-        default=device_types,
+        device_types,
         key=f"device_type_filter_{key_prefix}",
-        help="Filter by device type",
+        help_text="Filter by device type",
+        placeholder="All device types",
     )
 
     return selected_types
@@ -157,56 +408,75 @@ def apply_filters(
     device_types: list[str] = None,
     advanced_filters: dict = None,
 ) -> pd.DataFrame:
-    """Apply all filters to the data."""
-    filtered_data = data.copy()
+    """
+    Apply all filters to the data; empty selections do not filter.
+
+    Both date bounds are inclusive, so end_date should already be the end of
+    the last day to include, as returned by the date and preset filters.
+    """
+    # Combine every predicate into one mask and slice the data only once
+    mask = np.ones(len(data), dtype=bool)
+
+    countries = _active_selection(data, "Country", countries)
+    statuses = _active_selection(data, "status", statuses)
+    sites = _active_selection(data, "site_name", sites)
+    device_types = _active_selection(data, "device_type", device_types)
+
+    if "_scope" in data.columns:
+        # Country, site and device type filters in one pass over the scope key
+        if countries or sites or device_types:
+            mask &= _scope_mask(
+                data,
+                {"Country": countries, "site_name": sites, "device_type": device_types},
+            )
+    else:
+        # Country filter
+        if countries:
+            mask &= _selection_mask(data, "Country", countries)
+
+        # Site filter
+        if sites:
+            mask &= _selection_mask(data, "site_name", sites)
 
-    # Country filter
-    if countries and "Country" in filtered_data.columns:
-        filtered_data = filtered_data[filtered_data["Country"].isin(countries)]
+        # Device type filter
+        if device_types:
+            mask &= _selection_mask(data, "device_type", device_types)
 
     # Status filter
-    if statuses and "status" in filtered_data.columns:
-        filtered_data = filtered_data[filtered_data["status"].isin(statuses)]
+    if statuses:
+        mask &= _selection_mask(data, "status", statuses)
 
     # Date range filter
-    if start_date and end_date and "last_file" in filtered_data.columns:
-        last_file_dates = pd.to_datetime(filtered_data["last_file"], errors="coerce")
-
-        # Convert start_date and end_date to same timezone as data
-        # (or make timezone-naive)
-        start_date_naive = (
-            start_date.tz_localize(None) if start_date.tzinfo else start_date
-        )
-        end_date_naive = end_date.tz_localize(None) if end_date.tzinfo else end_date
-
-        # Make end_date inclusive by extending to end of day
-        end_date_inclusive = (
-            end_date_naive + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
-        )
-
-        # Ensure dates are timezone-naive for comparison
-        if last_file_dates.dt.tz is not None:
-            last_file_dates = last_file_dates.dt.tz_convert(None)
-
-        # Include devices with missing dates OR dates within the range
-        date_mask = (
-            last_file_dates.isna()  # Include devices with missing dates
-            | (
-                (last_file_dates >= start_date_naive)
-                & (last_file_dates <= end_date_inclusive)
-            )
-        )
-        filtered_data = filtered_data[date_mask]
-
-    # Site filter
-    if sites and "site_name" in filtered_data.columns:
-        filtered_data = filtered_data[filtered_data["site_name"].isin(sites)]
-
-    # Device type filter
-    if device_types and "device_type" in filtered_data.columns:
-        filtered_data = filtered_data[filtered_data["device_type"].isin(device_types)]
-
-    return filtered_data
+    if start_date and end_date and "last_file" in data.columns:
+        # Compare nanoseconds since the epoch; .value is UTC for aware dates too
+        mask &= _date_mask(data, start_date.value, end_date.value)
+
+    # Advanced filters, evaluated on the raw numpy arrays
+    if advanced_filters:
+        days_threshold = advanced_filters.get("days_threshold")
+        if days_threshold is not None and "days_since_last" in data.columns:
+            days = _float_array(data["days_since_last"])
+            # Devices without a finite value are kept, like missing dates
+            keep = np.isfinite(days)
+            np.logical_not(keep, out=keep)
+            keep |= days <= days_threshold
+            mask &= keep
+
+        min_recordings = advanced_filters.get("min_recordings")
+        if min_recordings is not None and "total_recordings" in data.columns:
+            mask &= _float_array(data["total_recordings"]) >= min_recordings
+
+        for column, bounds in (
+            ("latitude", advanced_filters.get("lat_range")),
+            ("longitude", advanced_filters.get("lon_range")),
+        ):
+            if bounds is not None and column in data.columns:
+                values = _float_array(data[column])
+                # Narrow the mask in place rather than building a range mask
+                mask &= values >= bounds[0]
+                mask &= values <= bounds[1]
+
+    return data.iloc[mask]
 
 
 def render_advanced_filters(data: pd.DataFrame, key_prefix: str = "main") -> dict:
@@ -219,12 +489,8 @@ def render_advanced_filters(data: pd.DataFrame, key_prefix: str = "main") -> dic
     with col1:
         # Days since last recording filter
         if "days_since_last" in data.columns:
-            max_days_value = (
-                data["days_since_last"]
-                .replace([float("inf"), float("-inf")], float("nan"))
-                .max()
-            )
-            max_days = int(max_days_value) if not pd.isna(max_days_value) else 30
+            days_range = _column_range(data["days_since_last"])
+            max_days = int(days_range[1]) if days_range else 30
 
             days_threshold = st.slider(
                 "📅 Maximum days since last recording",
@@ -254,42 +520,23 @@ def render_advanced_filters(data: pd.DataFrame, key_prefix: str = "main") -> dic
         if "latitude" in data.columns and "longitude" in data.columns:
             st.markdown("**📍 Geographic Bounds**")
 
+            lat_min, lat_max = _column_range(data["latitude"]) or (-90.0, 90.0)
+            lon_min, lon_max = _column_range(data["longitude"]) or (-180.0, 180.0)
+
             lat_range = st.slider(
                 "Latitude range",
-                min_value=float(data["latitude"].min())
-                if not data["latitude"].isna().all()
-                else -90.0,
-                max_value=float(data["latitude"].max())
-                if not data["latitude"].isna().all()
-                else 90.0,
-                value=(
-                    float(data["latitude"].min())
-                    if not data["latitude"].isna().all()
-                    else -90.0,
-                    float(data["latitude"].max())
-                    if not data["latitude"].isna().all()
-                    else 90.0,
-                ),
+                min_value=lat_min,
+                max_value=lat_max,
+                value=(lat_min, lat_max),
                 key=f"lat_range_filter_{key_prefix}",
                 help="Filter by latitude range",
             )
 
             lon_range = st.slider(
                 "Longitude range",
-                min_value=float(data["longitude"].min())
-                if not data["longitude"].isna().all()
-                else -180.0,
-                max_value=float(data["longitude"].max())
-                if not data["longitude"].isna().all()
-                else 180.0,
-                value=(
-                    float(data["longitude"].min())
-                    if not data["longitude"].isna().all()
-                    else -180.0,
-                    float(data["longitude"].max())
-                    if not data["longitude"].isna().all()
-                    else 180.0,
-                ),
+                min_value=lon_min,
+                max_value=lon_max,
+                value=(lon_min, lon_max),
                 key=f"lon_range_filter_{key_prefix}",
                 help="Filter by longitude range",
             )
@@ -305,91 +552,44 @@ def render_advanced_filters(data: pd.DataFrame, key_prefix: str = "main") -> dic
     }
 
 
-def get_preset_filters(preset: str, data: pd.DataFrame) -> dict:
-    """Get filter parameters for a given preset."""
-    from datetime import datetime
+def _build_preset_filters(preset: str, data: pd.DataFrame, current_date: date) -> dict:
+    """Build the filter parameters of a preset for the given date."""
+    spec = _PRESET_SPECS.get(preset, _PRESET_SPECS["🌟 All Devices"])
 
-    # Default values
-    all_countries = (
-        list(data["Country"].dropna().unique()) if "Country" in data.columns else []
-    )
-    all_sites = (
-        list(data["site_name"].dropna().unique()) if "site_name" in data.columns else []
-    )
-    all_statuses = ["Online", "Offline"]
+    # None means "no filter" for countries, statuses and sites
+    countries = spec["countries"]
+    if countries is not None:
+        all_countries = (
+            _column_options(data, "Country") if "Country" in data.columns else []
+        )
+        # Show every country if the preset's country has no devices
+        if not set(countries).issubset(all_countries):
+            countries = None
 
-    current_date = datetime.now().date()
+    if spec["days"] is None:
+        start_date = _HISTORY_START_DATE
+    else:
+        start_date = pd.Timestamp(current_date - timedelta(days=spec["days"]))
 
-    presets = {
-        "🌟 All Devices": {
-            "countries": all_countries,
-            "statuses": all_statuses,
-            "start_date": pd.Timestamp(date(2020, 1, 1), tz="UTC"),
-            "end_date": pd.Timestamp(current_date, tz="UTC"),
-            "sites": all_sites,
-            "description": "Show all devices without any filters",
-        },
-        "✅ Online Devices Only": {
-            "countries": all_countries,
-            "statuses": ["Online"],
-            "start_date": pd.Timestamp(date(2020, 1, 1), tz="UTC"),
-            "end_date": pd.Timestamp(current_date, tz="UTC"),
-            "sites": all_sites,
-            "description": "Show only devices that are currently online",
-        },
-        "❌ Offline Devices Only": {
-            "countries": all_countries,
-            "statuses": ["Offline"],
-            "start_date": pd.Timestamp(date(2020, 1, 1), tz="UTC"),
-            "end_date": pd.Timestamp(current_date, tz="UTC"),
-            "sites": all_sites,
-            "description": "Show only devices that are currently offline",
-        },
-        "📅 Recent Activity (Last 30 days)": {
-            "countries": all_countries,
-            "statuses": all_statuses,
-            "start_date": pd.Timestamp(current_date - timedelta(days=30), tz="UTC"),
-            "end_date": pd.Timestamp(current_date, tz="UTC"),
-            "sites": all_sites,
-            "description": "Show devices with activity in the last 30 days",
-        },
-        "🇳🇴 Norway Only": {
-            "countries": ["Norway"] if "Norway" in all_countries else all_countries,
-            "statuses": all_statuses,
-            "start_date": pd.Timestamp(date(2020, 1, 1), tz="UTC"),
-            "end_date": pd.Timestamp(current_date, tz="UTC"),
-            "sites": all_sites,
-            "description": "Show only devices deployed in Norway",
-        },
-        "🇳🇱 Netherlands Only": {
-            "countries": ["Netherlands"]
-            if "Netherlands" in all_countries
-            else all_countries,
-            "statuses": all_statuses,
-            "start_date": pd.Timestamp(date(2020, 1, 1), tz="UTC"),
-            "end_date": pd.Timestamp(current_date, tz="UTC"),
-            "sites": all_sites,
-            "description": "Show only devices deployed in the Netherlands",
-        },
-        "🇫🇷 France Only": {
-            "countries": ["France"] if "France" in all_countries else all_countries,
-            "statuses": all_statuses,
-            "start_date": pd.Timestamp(date(2020, 1, 1), tz="UTC"),
-            "end_date": pd.Timestamp(current_date, tz="UTC"),
-            "sites": all_sites,
-            "description": "Show only devices deployed in France",
-        },
-        "🇪🇸 Spain Only": {
-            "countries": ["Spain"] if "Spain" in all_countries else all_countries,
-            "statuses": all_statuses,
-            "start_date": pd.Timestamp(date(2020, 1, 1), tz="UTC"),
-            "end_date": pd.Timestamp(current_date, tz="UTC"),
-            "sites": all_sites,
-            "description": "Show only devices deployed in Spain",
-        },
+    return {
+        "countries": countries,
+        "statuses": spec["statuses"],
+        "start_date": start_date,
+        "end_date": pd.Timestamp(current_date) + _END_OF_DAY,
+        "sites": None,
+        "description": spec["description"],
     }
 
-    return presets.get(preset, presets["🌟 All Devices"])
+
+def get_preset_filters(preset: str, data: pd.DataFrame) -> dict:
+    """Get filter parameters for a given preset."""
+    # Presets only depend on the data and the current date, so reuse them
+    current_date = datetime.now().date()
+    presets = _filter_cache(data)
+    key = ("_preset", preset, current_date)
+    if key not in presets:
+        presets[key] = _build_preset_filters(preset, data, current_date)
+    return presets[key]
 
 
 def render_smart_preset_filters(
@@ -399,17 +599,7 @@ def render_smart_preset_filters(
     render_info_section_header("🔍 Quick Filters", style_class="quick-filters-header")
 
     # Preset selection
-    preset_options = [
-        "🌟 All Devices",
-        "✅ Online Devices Only",
-        "❌ Offline Devices Only",
-        "📅 Recent Activity (Last 30 days)",
-        "🇳🇴 Norway Only",
-        "🇳🇱 Netherlands Only",
-        "🇫🇷 France Only",
-        "🇪🇸 Spain Only",
-        "⚙️ Custom Filters",
-    ]
+    preset_options = [*_PRESET_SPECS, "⚙️ Custom Filters"]
 
     preset = st.selectbox(
         "Choose a filter preset:",
@@ -424,7 +614,7 @@ def render_smart_preset_filters(
         st.info(f"ℹ️ {preset_config['description']}")
 
         # Apply preset filters
-        filtered_data = apply_filters(
+        filtered_data = _memoized_apply_filters(
             data,
             countries=preset_config["countries"],
             statuses=preset_config["statuses"],
@@ -454,9 +644,14 @@ def render_smart_preset_filters(
         start_date, end_date = render_date_range_filter(data, key_prefix=key_prefix)
 
         # Apply custom filters
-        filtered_data = apply_filters(
-            data, countries, statuses, start_date, end_date, sites
-        )
+        base_filters = {
+            "countries": countries,
+            "statuses": statuses,
+            "start_date": start_date,
+            "end_date": end_date,
+            "sites": sites,
+        }
+        filtered_data = _memoized_apply_filters(data, **base_filters)
 
         active_filters = {
             "countries": countries,
@@ -474,46 +669,9 @@ def render_smart_preset_filters(
             )
 
             # Apply advanced filters
-            if (
-                advanced_filters["days_threshold"] is not None
-                and "days_since_last" in filtered_data.columns
-            ):
-                days_since_clean = filtered_data["days_since_last"].replace(
-                    [float("inf"), float("-inf")], float("nan")
-                )
-                filtered_data = filtered_data[
-                    days_since_clean.isna()
-                    | (days_since_clean <= advanced_filters["days_threshold"])
-                ]
-
-            if (
-                advanced_filters["min_recordings"] is not None
-                and "total_recordings" in filtered_data.columns
-            ):
-                filtered_data = filtered_data[
-                    filtered_data["total_recordings"]
-                    >= advanced_filters["min_recordings"]
-                ]
-
-            if (
-                advanced_filters["lat_range"] is not None
-                and "latitude" in filtered_data.columns
-            ):
-                lat_min, lat_max = advanced_filters["lat_range"]
-                filtered_data = filtered_data[
-                    (filtered_data["latitude"] >= lat_min)
-                    & (filtered_data["latitude"] <= lat_max)
-                ]
-
-            if (
-                advanced_filters["lon_range"] is not None
-                and "longitude" in filtered_data.columns
-            ):
-                lon_min, lon_max = advanced_filters["lon_range"]
-                filtered_data = filtered_data[
-                    (filtered_data["longitude"] >= lon_min)
-                    & (filtered_data["longitude"] <= lon_max)
-                ]
+            filtered_data = _memoized_apply_filters(
+                data, **base_filters, advanced_filters=advanced_filters
+            )
 
             # Merge advanced filters into active filters
             active_filters.update(advanced_filters)
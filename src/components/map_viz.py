@@ -2,20 +2,99 @@
 Map visualization components for the TABMON dashboard.
 """
 
+import string
+
 import folium
+import numpy as np
 import pandas as pd
 import streamlit as st
-from folium.plugins import MarkerCluster
+from folium.plugins import FastMarkerCluster, MarkerCluster
 from streamlit_folium import st_folium
 
 from components.auth import get_map_zoom_level
-from config.settings import DEFAULT_ZOOM, MAP_HEIGHT, MAP_WIDTH, MIN_ZOOM_LEVEL
+from config.settings import (
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL,
+    DEFAULT_ZOOM,
+    FAST_MARKER_THRESHOLD,
+    MAP_HEIGHT,
+    MAP_WIDTH,
+    MIN_ZOOM_LEVEL,
+)
+
+# Marker fields and the device columns they are read from, in order of preference
+MARKER_COLUMNS = {
+    "Latitude": ["Latitude"],
+    "Longitude": ["Longitude"],
+    "site_name": ["site_name", "Site"],
+    "cluster_name": ["cluster_name", "Cluster"],
+    "device_name": ["device_name", "DeploymentID", "device"],
+    "Country": ["Country"],
+    "status": ["status"],
+    "last_file": ["last_file", "last_recorded", "recorded_at"],
+    "days_since_last": ["days_since_last"],
+    "total_recordings": ["total_recordings"],
+}
 
+# Marker cluster settings shared by the folium and in-browser marker layers
+CLUSTER_OPTIONS = {
+    "maxClusterRadius": 40,
+    "showCoverageOnHover": False,
+    "spiderfyOnMaxZoom": True,
+    "removeOutsideVisibleBounds": False,
+}
 
+# Popup markup for a single device, filled from the _popup_fields columns
+POPUP_TEMPLATE = """
+    <div style="font-family: Arial, sans-serif; min-width: 200px;">
+        <h4 style="margin: 0; color: #2E86AB; text-align: center;">🎙️ {device_id}</h4>
+        <hr style="margin: 10px 0;">
+        <p style="margin: 5px 0;"><b>📍 Site:</b> {location_text}</p>
+        <p style="margin: 5px 0;"><b>🌍 Country:</b> {country}</p>
+        <p style="margin: 5px 0;"><b>📶 Status:</b>
+            <span style="color: {status_color};
+                         font-weight: bold;">
+                {status}
+            </span>
+        </p>
+        <p style="margin: 5px 0;"><b>🕒 Last Recorded:</b> {last_recorded}</p>
+        <p style="margin: 5px 0;"><b>⏱️ Days Since:</b> {days_since}</p>
+        <p style="margin: 5px 0;"><b>🎵 Total Recordings:</b> {total_recordings}</p>
+    </div>
+    """
+
+# The template split once into (literal text, field name) pieces
+POPUP_TEMPLATE_PARTS = tuple(string.Formatter().parse(POPUP_TEMPLATE))
+
+# Builds a marker in the browser from a [lat, lon, popup, tooltip, online] row
+FAST_MARKER_CALLBACK = """(function () {
+    var icons = {
+        true: L.AwesomeMarkers.icon(
+            {icon: "play", markerColor: "green", iconColor: "white", prefix: "fa"}
+        ),
+        false: L.AwesomeMarkers.icon(
+            {icon: "pause", markerColor: "red", iconColor: "white", prefix: "fa"}
+        ),
+    };
+    return function (row) {
+        var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icons[row[4]]});
+        marker.bindPopup(row[2], {maxWidth: 300});
+        marker.bindTooltip(row[3], {sticky: true});
+        return marker;
+    };
+})()"""
+
+
+@st.fragment
 def render_device_map(
     site_info: pd.DataFrame, status_df: pd.DataFrame, max_zoom: int = None
 ):
-    """Render the interactive map with device locations."""
+    """
+    Render the interactive map with device locations.
+
+    The map runs as a fragment, so clicking or panning it only reruns the
+    map instead of the whole page with all of its filters.
+    """
     if site_info.empty:
         st.warning("⚠️ No site information available")
         return None
@@ -23,137 +102,156 @@ def render_device_map(
     # Use provided settings or get dynamic zoom level based on user authorization
     use_max_zoom = max_zoom if max_zoom is not None else get_map_zoom_level()
 
-    # Create map centered on device locations
-    center_lat = site_info["Latitude"].mean()
-    center_lon = site_info["Longitude"].mean()
+    # Center the map on the mean site coordinates
+    center = (float(site_info["Latitude"].mean()), float(site_info["Longitude"].mean()))
 
+    # Reruns with unchanged data reuse the map instead of rebuilding every marker
+    m = _build_device_map(center, _marker_data(status_df), use_max_zoom)
+
+    # Only the clicked marker's tooltip is sent back instead of the map state
+    return st_folium(
+        m,
+        width=MAP_WIDTH,
+        height=MAP_HEIGHT,
+        returned_objects=["last_object_clicked_tooltip"],
+    )
+
+
+def _frame_fingerprint(data: pd.DataFrame) -> bytes:
+    """Hash every row and the column names of a frame for cache keys."""
+    rows = pd.util.hash_pandas_object(data, index=True).to_numpy()
+    return rows.tobytes() + repr(list(data.columns)).encode()
+
+
+# Streamlit samples large frames when hashing them, so hash every row instead
+@st.cache_data(
+    ttl=CACHE_TTL,
+    max_entries=CACHE_MAX_ENTRIES,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: _frame_fingerprint},
+)
+def _build_device_map(
+    center: tuple[float, float], status_df: pd.DataFrame, max_zoom: int
+) -> folium.Map:
+    """Build the folium map with a marker for every device."""
+    # Create map centered on device locations
     m = folium.Map(
-        location=[center_lat, center_lon],
+        location=list(center),
         zoom_start=DEFAULT_ZOOM,
         tiles="OpenStreetMap",
-        max_zoom=use_max_zoom,
+        max_zoom=max_zoom,
         min_zoom=MIN_ZOOM_LEVEL,
     )
 
-    # Create marker cluster with optimal settings
-    marker_cluster = MarkerCluster(
-        maxClusterRadius=40,
-        showCoverageOnHover=False,
-        spiderfyOnMaxZoom=True,
-        removeOutsideVisibleBounds=False,
-    ).add_to(m)
-
-    marker_count = 0
-
-    # Add markers for each device
-    for _, row in status_df.iterrows():
-        # Handle different possible column names
-        site_name = row.get("site_name", row.get("Site", "Unknown Site"))
-        cluster_name = row.get("cluster_name", row.get("Cluster", ""))
-        location_text = f"{cluster_name}: {site_name}" if cluster_name else site_name
+    # Build every popup, tooltip and icon choice at once, outside the marker loop
+    fields = _popup_fields(status_df)
+    markers = list(
+        zip(
+            fields["Latitude"],
+            fields["Longitude"],
+            fields["popup_html"],
+            fields["tooltip"],
+            fields["online"].tolist(),
+            strict=True,
+        )
+    )
 
-        # Skip if no coordinates
-        if pd.isna(row.get("Latitude")) or pd.isna(row.get("Longitude")):
-            continue
+    if len(markers) > FAST_MARKER_THRESHOLD:
+        # Send many markers as one JSON array and create them in the browser
+        FastMarkerCluster(
+            [list(marker) for marker in markers],
+            callback=FAST_MARKER_CALLBACK,
+            **CLUSTER_OPTIONS,
+        ).add_to(m)
+        return m
 
-        popup_html = _create_popup_html(row, location_text)
+    marker_cluster = MarkerCluster(**CLUSTER_OPTIONS).add_to(m)
 
-        # Status-based styling
-        status = row.get("status", "Unknown")
-        icon_color = "green" if status == "Online" else "red"
-        icon_symbol = "play" if status == "Online" else "pause"
+    # Markers share one icon per status, so each icon is only emitted once
+    online_icon = folium.Icon(color="green", icon="play", prefix="fa")
+    offline_icon = folium.Icon(color="red", icon="pause", prefix="fa")
 
+    # Add markers for each device
+    for latitude, longitude, popup_html, tooltip, online in markers:
         folium.Marker(
-            location=[row["Latitude"], row["Longitude"]],
+            location=[latitude, longitude],
             popup=folium.Popup(popup_html, max_width=300),
-            tooltip=f"🎙️ {site_name} ({status})",
-            icon=folium.Icon(color=icon_color, icon=icon_symbol, prefix="fa"),
+            tooltip=tooltip,
+            icon=online_icon if online else offline_icon,
         ).add_to(marker_cluster)
-        marker_count += 1
 
-    return st_folium(
-        m, width=MAP_WIDTH, height=MAP_HEIGHT, returned_objects=["last_object_clicked"]
-    )
+    return m
 
 
-def _create_popup_html(row: pd.Series, location_text: str) -> str:
-    """Create HTML content for map marker popups."""
-    # Handle different possible column names and ensure we get scalar values
-    device_id = row.get(
-        "device_name", row.get("DeploymentID", row.get("device", "Unknown Device"))
-    )
+def _marker_data(status_df: pd.DataFrame) -> pd.DataFrame:
+    """Get the devices with coordinates, with their columns renamed for markers."""
+    # Read each marker field from the first matching column; missing ones are NaN
+    sources = {}
+    for name, aliases in MARKER_COLUMNS.items():
+        for alias in aliases:
+            if alias in status_df.columns:
+                sources[alias] = name
+                break
+    markers = status_df[list(sources)].rename(columns=sources)
+    markers = markers.reindex(columns=list(MARKER_COLUMNS))
+
+    has_location = markers["Latitude"].notna() & markers["Longitude"].notna()
+    return markers.loc[has_location].reset_index(drop=True)
+
+
+def _as_text(values: pd.Series, default: str) -> list[str]:
+    """Convert values to strings, replacing missing values with a default."""
+    return [default if pd.isna(value) else str(value) for value in values]
+
+
+def _popup_fields(markers: pd.DataFrame) -> pd.DataFrame:
+    """Extract and format the marker popup fields for every device."""
+    site_name = _as_text(markers["site_name"], "Unknown Site")
+    cluster_name = _as_text(markers["cluster_name"], "")
+
+    # Format all timestamps at once; other values are shown as they are
+    last_recorded = markers["last_file"]
+    if pd.api.types.is_datetime64_any_dtype(last_recorded):
+        last_recorded = last_recorded.dt.strftime("%Y-%m-%d %H:%M")
+
+    days_since = pd.to_numeric(markers["days_since_last"], errors="coerce")
+    total_recordings = pd.to_numeric(markers["total_recordings"], errors="coerce")
 
-    # Ensure device_id is a string, not a pandas Series
-    if hasattr(device_id, "iloc"):
-        device_id = device_id.iloc[0] if len(device_id) > 0 else "Unknown Device"
-    elif pd.isna(device_id):
-        device_id = "Unknown Device"
-    else:
-        device_id = str(device_id)
-
-    country = row.get("Country", "Unknown")
-    if hasattr(country, "iloc"):
-        country = country.iloc[0] if len(country) > 0 else "Unknown"
-    elif pd.isna(country):
-        country = "Unknown"
-    else:
-        country = str(country)
-
-    status = row.get("status", "Unknown")
-    if hasattr(status, "iloc"):
-        status = status.iloc[0] if len(status) > 0 else "Unknown"
-    elif pd.isna(status):
-        status = "Unknown"
-    else:
-        status = str(status)
-
-    last_recorded = row.get(
-        "last_file", row.get("last_recorded", row.get("recorded_at", "N/A"))
+    fields = pd.DataFrame(
+        {
+            "Latitude": markers["Latitude"],
+            "Longitude": markers["Longitude"],
+            "site_name": site_name,
+            "location_text": [
+                f"{cluster}: {site}" if cluster else site
+                for cluster, site in zip(cluster_name, site_name, strict=True)
+            ],
+            "device_id": _as_text(markers["device_name"], "Unknown Device"),
+            "country": _as_text(markers["Country"], "Unknown"),
+            "status": _as_text(markers["status"], "Unknown"),
+            "last_recorded": _as_text(last_recorded, "N/A"),
+            "days_since": [
+                "N/A" if np.isnan(days) else f"{days:.1f} days" for days in days_since
+            ],
+            "total_recordings": [
+                "N/A" if np.isnan(count) else str(int(count))
+                for count in total_recordings
+            ],
+        },
+        dtype=object,
     )
-    if hasattr(last_recorded, "iloc"):
-        last_recorded = last_recorded.iloc[0] if len(last_recorded) > 0 else "N/A"
-
-    if pd.notna(last_recorded) and hasattr(last_recorded, "strftime"):
-        last_recorded = last_recorded.strftime("%Y-%m-%d %H:%M")
-    elif pd.isna(last_recorded):
-        last_recorded = "N/A"
-
-    days_since = row.get("days_since_last", "N/A")
-    if hasattr(days_since, "iloc"):
-        days_since = days_since.iloc[0] if len(days_since) > 0 else "N/A"
-
-    if pd.notna(days_since) and days_since != "N/A":
-        try:
-            days_since = f"{float(days_since):.1f} days"
-        except (ValueError, TypeError):
-            days_since = "N/A"
-
-    total_recordings = row.get("total_recordings", "N/A")
-    if hasattr(total_recordings, "iloc"):
-        total_recordings = (
-            total_recordings.iloc[0] if len(total_recordings) > 0 else "N/A"
-        )
+    fields["online"] = fields["status"] == "Online"
+    fields["status_color"] = np.where(fields["online"], "green", "red")
+    fields["tooltip"] = "🎙️ " + fields["site_name"] + " (" + fields["status"] + ")"
+    fields["popup_html"] = _popup_html(fields)
+    return fields
 
-    if pd.notna(total_recordings) and total_recordings != "N/A":
-        try:
-            total_recordings = int(total_recordings)
-        except (ValueError, TypeError):
-            total_recordings = "N/A"
 
-    return f"""
-    <div style="font-family: Arial, sans-serif; min-width: 200px;">
-        <h4 style="margin: 0; color: #2E86AB; text-align: center;">🎙️ {device_id}</h4>
-        <hr style="margin: 10px 0;">
-        <p style="margin: 5px 0;"><b>📍 Site:</b> {location_text}</p>
-        <p style="margin: 5px 0;"><b>🌍 Country:</b> {country}</p>
-        <p style="margin: 5px 0;"><b>📶 Status:</b>
-            <span style="color: {"green" if status == "Online" else "red"};
-                         font-weight: bold;">
-                {status}
-            </span>
-        </p>
-        <p style="margin: 5px 0;"><b>🕒 Last Recorded:</b> {last_recorded}</p>
-        <p style="margin: 5px 0;"><b>⏱️ Days Since:</b> {days_since}</p>
-        <p style="margin: 5px 0;"><b>🎵 Total Recordings:</b> {total_recordings}</p>
-    </div>
-    """
+def _popup_html(fields: pd.DataFrame) -> pd.Series:
+    """Fill the popup template for every marker in one vectorized pass."""
+    html = pd.Series("", index=fields.index, dtype=object)
+    for literal, field, _, _ in POPUP_TEMPLATE_PARTS:
+        html = html + literal
+        if field is not None:
+            html = html + fields[field]
+    return html
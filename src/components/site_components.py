@@ -1,145 +1,234 @@
 import io
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pandas as pd
 import requests
 import streamlit as st
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from components.ui_styles import render_info_section_header
+from config.settings import (
+    CACHE_TTL,
+    IMAGE_FETCH_WORKERS,
+    IMAGE_MAX_SIDE,
+    IMAGES_FROM_BROWSER,
+)
 
 
-def render_site_filters(site_info: pd.DataFrame) -> tuple:
+def render_site_filters(countries: list, sites_by_country: dict) -> tuple:
     """Render country and site selection filters."""
     st.markdown("### 🌍 Site Selection")
 
     # Country filter
-    countries = site_info["Country"].dropna().unique().tolist()
     selected_country = st.selectbox(
-        "📍 Select Country", sorted(countries), key="site_country_filter"
+        "📍 Select Country", countries, key="site_country_filter"
     )
 
-    # Filter by country
-    filtered_site_info = site_info[site_info["Country"] == selected_country]
-
     # Site filter
-    sites = filtered_site_info["Site"].dropna().unique().tolist()
-    selected_site = st.selectbox("🏞️ Select Site", sorted(sites), key="site_site_filter")
+    selected_site = st.selectbox(
+        "🏞️ Select Site",
+        sites_by_country.get(selected_country, []),
+        key="site_site_filter",
+    )
 
-    return selected_country, selected_site, filtered_site_info
+    return selected_country, selected_site
 
 
-def render_site_details(filtered_data: pd.DataFrame, selected_site: str) -> None:
-    """Render detailed site information."""
-    site_data = filtered_data[filtered_data["Site"] == selected_site]
+def get_site_record(site_records: pd.DataFrame, country: str, site: str) -> pd.Series:
+    """Get the record of a site from the indexed site records, if there is one."""
+    if (country, site) not in site_records.index:
+        return None
+    return site_records.loc[(country, site)]
 
-    if site_data.empty:
-        st.error(f"❌ No data found for site: {selected_site}")
-        return
 
-    record = site_data.iloc[0]
+def render_site_details(record: pd.Series) -> None:
+    """Render detailed site information."""
+    # Read every field from a plain dict rather than through Series lookups
+    details = record.to_dict()
 
     # Create two columns for better layout
     col1, col2 = st.columns(2)
 
+    # Each column's fields go to the frontend as one markdown block
     with col1:
         st.markdown("#### 🌍 Location Information")
-        st.markdown(f"**Country:** {record.get('Country', 'N/A')}")
-        st.markdown(f"**Site:** {record.get('Site', 'N/A')}")
-        st.markdown(f"**Cluster:** {record.get('Cluster', 'N/A')}")
-
         # Coordinates
-        # latitude = record.get("Latitude", "N/A")
-        # longitude = record.get("Longitude", "N/A")
-        # st.markdown(f"**Coordinates:** {latitude}, {longitude}")
-
-        # Coordinate uncertainty
-        uncertainty = record.get("Coordinates_uncertainty", "N/A")
-        st.markdown(f"**Coordinate Uncertainty:** {uncertainty} meters")
-
-        # GPS device
-        gps_device = record.get("GPS_device", "N/A")
-        st.markdown(f"**GPS Device:** {gps_device}")
+        # latitude = details.get("Latitude", "N/A")
+        # longitude = details.get("Longitude", "N/A")
+        # f"**Coordinates:** {latitude}, {longitude}",
+        st.markdown(
+            "\n\n".join(
+                [
+                    f"**Country:** {details.get('Country', 'N/A')}",
+                    f"**Site:** {details.get('Site', 'N/A')}",
+                    f"**Cluster:** {details.get('Cluster', 'N/A')}",
+                    "**Coordinate Uncertainty:** "
+                    f"{details.get('Coordinates_uncertainty', 'N/A')} meters",
+                    f"**GPS Device:** {details.get('GPS_device', 'N/A')}",
+                ]
+            )
+        )
 
     with col2:
         st.markdown("#### 🎙️ Device Information")
-        st.markdown(f"**Device ID:** {record.get('DeviceID', 'N/A')}")
-        st.markdown(f"**Deployment ID:** {record.get('DeploymentID', 'N/A')}")
-
-        # Microphone details
-        mic_height = record.get("Microphone_height", "N/A")
-        st.markdown(f"**Microphone Height:** {mic_height} cm")
-
-        mic_direction = record.get("Microphone_direction", "N/A")
-        st.markdown(f"**Microphone Direction:** {mic_direction}")
-
-        # Habitat
-        habitat = record.get("12. Habitat", "N/A")
-        st.markdown(f"**Habitat:** {habitat}")
-
-        # Score
-        score = record.get("Score", "N/A")
-        st.markdown(f"**Quality Score:** {score}")
+        st.markdown(
+            "\n\n".join(
+                [
+                    f"**Device ID:** {details.get('DeviceID', 'N/A')}",
+                    f"**Deployment ID:** {details.get('DeploymentID', 'N/A')}",
+                    "**Microphone Height:** "
+                    f"{details.get('Microphone_height', 'N/A')} cm",
+                    "**Microphone Direction:** "
+                    f"{details.get('Microphone_direction', 'N/A')}",
+                    f"**Habitat:** {details.get('12. Habitat', 'N/A')}",
+                    f"**Quality Score:** {details.get('Score', 'N/A')}",
+                ]
+            )
+        )
 
     # Deployment timeline
     st.markdown("#### ⏰ Deployment Timeline")
     col1, col2 = st.columns(2)
 
     with col1:
-        begin_date = record.get("deploymentBeginDate", "N/A")
-        begin_time = record.get("deploymentBeginTime", "N/A")
+        begin_date = details.get("deploymentBeginDate", "N/A")
+        begin_time = details.get("deploymentBeginTime", "N/A")
         st.markdown(f"**Start:** {begin_date} {begin_time}")
 
     with col2:
-        end_date = record.get("deploymentEndDate", "N/A")
-        end_time = record.get("deploymentEndTime", "N/A")
+        end_date = details.get("deploymentEndDate", "N/A")
+        end_time = details.get("deploymentEndTime", "N/A")
         st.markdown(f"**End:** {end_date} {end_time}")
 
     # Contact and comments
     st.markdown("#### 📝 Additional Information")
-    email = record.get("Adresse e-mail", "N/A")
+    additional = []
+    email = details.get("Adresse e-mail", "N/A")
     if email != "N/A":
-        st.markdown(f"**Contact:** {email}")
+        additional.append(f"**Contact:** {email}")
 
-    comments = record.get("Comments", "N/A")
+    comments = details.get("Comments", "N/A")
     if comments != "N/A":
-        st.markdown(f"**Comments:** {comments}")
+        additional.append(f"**Comments:** {comments}")
+
+    if additional:
+        st.markdown("\n\n".join(additional))
+
+
+@st.cache_resource
+def _http_session() -> requests.Session:
+    """Get a shared HTTP session so image downloads reuse open connections."""
+    session = requests.Session()
+    # Keep a pooled connection for every download worker, and retry
+    # transient connection and gateway failures instead of showing a
+    # broken image
+    adapter = HTTPAdapter(
+        pool_maxsize=IMAGE_FETCH_WORKERS,
+        max_retries=Retry(
+            total=2, backoff_factor=0.1, status_forcelist=(502, 503, 504)
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
+@st.cache_data(ttl=CACHE_TTL, max_entries=256, show_spinner=False)
+def download_image(url: str, max_side: int = IMAGE_MAX_SIDE) -> bytes:
+    """
+    Download an image as a JPEG thumbnail no larger than max_side pixels.
 
-@st.cache_data
-def download_image(url):
-    # TODO: create a thumbnail for faster loading
-    response = requests.get(url, timeout=30)
+    Re-encoding the image also drops its EXIF metadata, and the cache holds
+    the small compressed bytes rather than a full decoded image.
+    """
+    response = _http_session().get(url, timeout=30)
     response.raise_for_status()
 
     image = Image.open(io.BytesIO(response.content))
+    # Let the JPEG decoder skip detail that the thumbnail would discard
+    image.draft("RGB", (max_side, max_side))
+    image.thumbnail((max_side, max_side), Image.Resampling.BILINEAR)
 
-    image_without_exif = Image.new(image.mode, image.size)
-    image_without_exif.putdata(image.getdata())
-    return image_without_exif
+    # JPEG has no alpha channel, so flatten transparent images onto white
+    # instead of letting their transparent areas turn black
+    if image.mode in ("RGBA", "LA") or (
+        image.mode == "P" and "transparency" in image.info
+    ):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+
+    thumbnail = io.BytesIO()
+    image.convert("RGB").save(thumbnail, format="JPEG", quality=82)
+    return thumbnail.getvalue()
 
 
 def render_image_grid(images_df: pd.DataFrame) -> None:
     """Render images in a responsive grid layout."""
     cols_per_row = 2
 
-    for i in range(0, len(images_df), cols_per_row):
+    if IMAGES_FROM_BROWSER:
+        # Hand the URLs to the browser, which fetches the files itself
+        sources = images_df["url"].tolist()
+    else:
+        # Start every download up front so the requests overlap instead of
+        # running one after another while the grid is drawn
+        with ThreadPoolExecutor(max_workers=IMAGE_FETCH_WORKERS) as executor:
+            sources = [executor.submit(download_image, url) for url in images_df["url"]]
+
+    # Read the captions once so the grid loop does no pandas indexing
+    images = list(zip(sources, images_df["picture_type"], strict=True))
+
+    for i in range(0, len(images), cols_per_row):
         cols = st.columns(cols_per_row)
 
-        for j, (_, row) in enumerate(images_df.iloc[i : i + cols_per_row].iterrows()):
-            with cols[j]:
+        for col, (source, picture_type) in zip(
+            cols, images[i : i + cols_per_row], strict=False
+        ):
+            with col:
                 try:
                     # Get the original URL (already has /data/ prefix)
 
                     st.image(
-                        download_image(row["url"]),
-                        caption=row["picture_type"].title(),
+                        _image_source(source),
+                        caption=picture_type.title(),
                         use_container_width=True,
                     )
 
                 except Exception as e:
                     st.error(f"Error loading image: {str(e)}")
                     # Fallback to broken link message
-                    st.markdown(f"**{row['picture_type'].title()}**: Image unavailable")
+                    st.markdown(f"**{picture_type.title()}**: Image unavailable")
+
+
+def _image_source(source):
+    """Get the image to display from a URL or a pending download."""
+    return source.result() if isinstance(source, Future) else source
+
+
+@st.cache_resource
+def _prefetch_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool that downloads images ahead of rendering."""
+    return ThreadPoolExecutor(max_workers=IMAGE_FETCH_WORKERS)
+
+
+def prefetch_device_images(device_id: str, pictures_mapping: pd.DataFrame) -> None:
+    """
+    Start downloading a device's images in the background.
+
+    The downloads fill the download_image cache while the rest of the page
+    renders, so render_device_images can pick them up without waiting.
+    """
+    if IMAGES_FROM_BROWSER or "deviceID" not in pictures_mapping.columns:
+        return
+
+    device_images = pictures_mapping[pictures_mapping["deviceID"] == device_id]
+    executor = _prefetch_executor()
+    for url in device_images["url"]:
+        executor.submit(download_image, url)
 
 
 def render_device_images(device_id: str, pictures_mapping: pd.DataFrame) -> None:
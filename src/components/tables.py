@@ -25,17 +25,20 @@ def render_status_table(status_df: pd.DataFrame):
 
     # Check which columns exist
     available_cols = [col for col in display_cols if col in status_df.columns]
-    table_data = status_df[available_cols].copy()
+    table_data = status_df[available_cols]
 
     # Format dates and handle NaN values
     if "last_recorded" in table_data.columns:
-        table_data["last_recorded"] = table_data["last_recorded"].apply(
-            lambda x: x.strftime("%Y-%m-%d %H:%M") if pd.notna(x) else "Never"
+        last_recorded = table_data["last_recorded"]
+        table_data["last_recorded"] = last_recorded.dt.strftime("%Y-%m-%d %H:%M").where(
+            last_recorded.notna(), "Never"
         )
 
     if "days_since_last" in table_data.columns:
-        table_data["days_since_last"] = table_data["days_since_last"].apply(
-            lambda x: f"{x:.1f}" if pd.notna(x) else "N/A"
+        table_data["days_since_last"] = (
+            table_data["days_since_last"]
+            .map("{:.1f}".format, na_action="ignore")
+            .fillna("N/A")
         )
 
     # Rename columns for better display
@@ -48,18 +51,21 @@ def render_status_table(status_df: pd.DataFrame):
 
     table_data = table_data.rename(columns=column_rename)
 
-    # Style function for better visual appeal
-    def style_status(row):
-        if "Status" in row and row["Status"] == "Online":
-            return ["background-color: #d4edda; color: #155724"] * len(row)
-        elif "Status" in row and row["Status"] == "Offline":
-            return ["background-color: #f8d7da; color: #721c24"] * len(row)
-        else:
-            return [""] * len(row)
+    # Style function for better visual appeal, colouring whole rows by status
+    def style_status(data: pd.DataFrame) -> pd.DataFrame:
+        styles = pd.DataFrame("", index=data.index, columns=data.columns)
+        if "Status" in data.columns:
+            styles[data["Status"] == "Online"] = (
+                "background-color: #d4edda; color: #155724"
+            )
+            styles[data["Status"] == "Offline"] = (
+                "background-color: #f8d7da; color: #721c24"
+            )
+        return styles
 
     # Display the table
     try:
-        styled_df = table_data.style.apply(style_status, axis=1)
+        styled_df = table_data.style.apply(style_status, axis=None)
         st.dataframe(styled_df, use_container_width=True, height=400)
     except Exception:
         # Fallback to unstyled table if styling fails
@@ -73,13 +79,19 @@ def render_summary_table(status_df: pd.DataFrame):
 
     # Group by country and calculate summary stats
     if "Country" in status_df.columns:
+        # Sum a precomputed online flag so the aggregation stays vectorized
         summary = (
-            status_df.groupby("Country")
-            .agg({"status": lambda x: (x == "Online").sum(), "DeploymentID": "count"})
+            status_df.assign(_online=status_df["status"] == "Online")
+            .groupby("Country", observed=True)
+            .agg(
+                **{
+                    "Online Devices": ("_online", "sum"),
+                    "Total Devices": ("DeploymentID", "count"),
+                }
+            )
             .reset_index()
         )
 
-        summary.columns = ["Country", "Online Devices", "Total Devices"]
         summary["Offline Devices"] = (
             summary["Total Devices"] - summary["Online Devices"]
         )
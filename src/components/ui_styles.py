@@ -2,13 +2,20 @@
 UI styling and custom CSS for the TABMON dashboard.
 """
 
+import re
+
 import streamlit as st
 
 
-def load_custom_css():
-    """Load custom CSS styles for the dashboard."""
-    st.markdown(
-        """
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a CSS block."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    return re.sub(r"\s+", " ", css).strip()
+
+
+# Minified once at import; it is still sent on every rerun because
+# Streamlit removes any element that a rerun does not emit again
+CUSTOM_CSS = _minify_css("""
     <style>
     .main > div {
         padding-top: 2rem;
@@ -200,9 +207,12 @@ def load_custom_css():
         color: #1976d2;
     }
     </style>
-    """,
-        unsafe_allow_html=True,
-    )
+    """)
+
+
+def load_custom_css():
+    """Load custom CSS styles for the dashboard."""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 
 def render_info_section_header(
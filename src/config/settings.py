@@ -2,6 +2,8 @@
 Configuration settings for the TABMON dashboard.
 """
 
+from types import MappingProxyType
+
 # Application settings
 APP_TITLE = "TABMON Device Monitoring Dashboard"
 APP_ICON = "🎙️"
@@ -11,18 +13,25 @@ LAYOUT = "wide"
 OFFLINE_THRESHOLD_DAYS = 3
 DATA_START_DATE = "2025-01-01"
 
+# Filter settings
+MAX_FILTER_OPTIONS = 50  # Maximum number of options shown in a filter dropdown
+MAX_MULTISELECT_OPTIONS = 200  # Above this, filters use a text search instead
+
 # Country mapping
-COUNTRY_MAP = {
-    "proj_tabmon_NINA": "Norway",
-    "proj_tabmon_NINA_ES": "Spain",
-    "proj_tabmon_NINA_NL": "Netherlands",
-    "proj_tabmon_NINA_FR": "France",
-}
+COUNTRY_MAP = MappingProxyType(
+    {
+        "proj_tabmon_NINA": "Norway",
+        "proj_tabmon_NINA_ES": "Spain",
+        "proj_tabmon_NINA_NL": "Netherlands",
+        "proj_tabmon_NINA_FR": "France",
+    }
+)
 
 # Map settings
 DEFAULT_ZOOM = 6
 MAP_HEIGHT = 600
 MAP_WIDTH = 1200
+FAST_MARKER_THRESHOLD = 200  # Above this many devices, markers are built in JS
 
 # Privacy protection settings
 MAX_ZOOM_LEVEL = 7  # Maximum zoom level for public access
@@ -41,18 +50,29 @@ HEATMAP_ROW_HEIGHT = 25
 
 # Cache settings
 CACHE_TTL = 3600  # 1 hour
+CACHE_MAX_ENTRIES = 64  # Results kept per cached function that takes arguments
+
+# Image settings
+IMAGE_FETCH_WORKERS = 8  # Device images downloaded concurrently
+IMAGE_MAX_SIDE = 800  # Longest side of device image thumbnails, in pixels
+# Let browsers load device images straight from their URLs instead of through
+# the server. Only enable this when the URLs are reachable from browsers and
+# the photos carry no EXIF location data, as the original files are served.
+IMAGES_FROM_BROWSER = False
 
 # UI Colors
-COLORS = {
-    "primary": "#2E86AB",
-    "secondary": "#667eea",
-    "success": "#11998e",
-    "warning": "#feca57",
-    "danger": "#ff6b6b",
-    "info": "#764ba2",
-    "light": "#f8f9fa",
-    "dark": "#343a40",
-}
+COLORS = MappingProxyType(
+    {
+        "primary": "#2E86AB",
+        "secondary": "#667eea",
+        "success": "#11998e",
+        "warning": "#feca57",
+        "danger": "#ff6b6b",
+        "info": "#764ba2",
+        "light": "#f8f9fa",
+        "dark": "#343a40",
+    }
+)
 
 # Data source URLs
 BASE_DATA_URL = "http://rclone:8081/data"
@@ -64,7 +84,7 @@ ASSETS_SITE_CSV = "assets/site_info.csv"
 ASSETS_PARQUET_FILE = "assets/index.parquet"
 
 # Tab icons
-TAB_ICONS = {"map": "🗺️", "status": "📊", "activity": "📈"}
+TAB_ICONS = MappingProxyType({"map": "🗺️", "status": "📊", "activity": "📈"})
 
 # Map settings
 DEFAULT_MAP_ZOOM = 6
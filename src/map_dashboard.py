@@ -36,6 +36,7 @@ def app():
     # Load all data
     with st.spinner("Loading device data..."):
         device_data = data_service.load_device_status()
+        site_info = data_service.load_site_info()
 
     # Calculate metrics
     metrics = data_service.calculate_metrics(device_data)
@@ -54,7 +55,7 @@ def app():
     )
 
     with tab1:
-        render_map_tab(device_data, data_service)
+        render_map_tab(device_data, site_info)
 
     with tab2:
         render_status_tab(device_data, metrics, data_service)
@@ -73,7 +74,7 @@ def app():
     )
 
 
-def render_map_tab(device_data: pd.DataFrame, data_service: DataService):
+def render_map_tab(device_data: pd.DataFrame, site_info: pd.DataFrame):
     """Render the interactive map tab."""
     st.markdown("### Device Locations and Status")
 
@@ -100,9 +101,6 @@ def render_map_tab(device_data: pd.DataFrame, data_service: DataService):
     )
 
     if not filtered_data.empty:
-        # Get site info for the map
-        site_info = data_service.load_site_info()
-
         # Render the interactive map with hardcoded zoom limits for privacy
         render_device_map(site_info, filtered_data)
 
@@ -126,7 +124,7 @@ def render_map_tab(device_data: pd.DataFrame, data_service: DataService):
         with col1:
             st.metric("Devices Shown", len(filtered_data))
         with col2:
-            online_count = len(filtered_data[filtered_data["status"] == "Online"])
+            online_count = int((filtered_data["status"] == "Online").sum())
             st.metric(
                 "Online",
                 online_count,
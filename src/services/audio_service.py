@@ -6,7 +6,7 @@ Handles audio file operations and data processing for the TABMON dashboard.
 import pandas as pd
 import streamlit as st
 
-from config.settings import BASE_DATA_URL, CACHE_TTL
+from config.settings import BASE_DATA_URL, CACHE_MAX_ENTRIES, CACHE_TTL
 
 
 class AudioService:
@@ -15,7 +15,7 @@ class AudioService:
     def __init__(self):
         self.BASE_DIR = BASE_DATA_URL
 
-    @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+    @st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
     def get_device_stats(_self, short_device_id: str) -> dict:
         """Get preprocessed statistics for a specific device."""
         device_stats_url = f"{_self.BASE_DIR}/data/preprocessed/all_device_stats.csv"
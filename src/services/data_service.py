@@ -7,7 +7,12 @@ import pandas as pd
 import streamlit as st
 
 from config.settings import BASE_DATA_URL, CACHE_TTL, PARQUET_FILE_URL, SITE_CSV_URL
-from utils.data_loader import load_site_info
+from utils.data_loader import (
+    index_site_records,
+    load_device_status,
+    load_site_info,
+    site_options,
+)
 
 
 class DataService:
@@ -20,17 +25,41 @@ class DataService:
         self._temp_files = {}
         self.base_dir = BASE_DATA_URL
 
-    @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+    @st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
     def load_device_status(_self) -> pd.DataFrame:
-        """Load device status from preprocessed CSV file."""
+        """
+        Load device status from preprocessed CSV file.
+
+        The same frame is shared across reruns so filter caches can key on it;
+        callers must not modify it in place.
+        """
         device_status_url = f"{_self.base_dir}/data/preprocessed/device_status.csv"
-        df = pd.read_csv(device_status_url)
-        return df
+        return load_device_status(device_status_url)
 
     @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
     def load_site_info(_self) -> pd.DataFrame:
         return load_site_info(f"{_self.base_dir}/site_info.csv")
 
+    @st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+    def load_site_records(_self) -> pd.DataFrame:
+        """
+        Load site info indexed by (Country, Site), with one row per site.
+
+        The index is built once per load and shared across reruns; callers
+        must not modify it in place.
+        """
+        return index_site_records(_self.load_site_info())
+
+    @st.cache_resource(ttl=CACHE_TTL, show_spinner=False)
+    def load_site_options(_self) -> tuple[list, dict]:
+        """
+        Load the sorted countries and the sorted sites of each country.
+
+        The options are built once per load and shared across reruns; callers
+        must not modify them in place.
+        """
+        return site_options(_self.load_site_info())
+
     @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
     def load_recording_matrix(_self) -> pd.DataFrame:
         return pd.read_csv(
@@ -44,7 +73,7 @@ class DataService:
             return {}
 
         total_devices = len(status_df)
-        online_devices = len(status_df[status_df["status"] == "Online"])
+        online_devices = int((status_df["status"] == "Online").sum())
         offline_devices = total_devices - online_devices
         online_percentage = (
             (online_devices / total_devices * 100) if total_devices > 0 else 0
@@ -7,6 +7,8 @@ import streamlit as st
 
 from components.sidebar import render_complete_sidebar
 from components.site_components import (
+    get_site_record,
+    prefetch_device_images,
     render_device_images,
     render_site_details,
     render_site_filters,
@@ -33,6 +35,8 @@ def show_site_dashboard() -> None:
     # Load data
     with st.spinner("🔄 Loading site and device information..."):
         site_info = data_service.load_site_info()
+        site_records = data_service.load_site_records()
+        countries, sites_by_country = data_service.load_site_options()
         device_data = data_service.load_device_status()
 
     with st.spinner("🔄 Loading device images..."):
@@ -53,17 +57,19 @@ def show_site_dashboard() -> None:
     render_info_section_header("🏞️ Site Information", style_class="site-info-header")
 
     # Site selection controls in main page
-    selected_country, selected_site, filtered_site_info = render_site_filters(site_info)
+    selected_country, selected_site = render_site_filters(countries, sites_by_country)
 
-    # Get site data
-    site_data = filtered_site_info[filtered_site_info["Site"] == selected_site]
+    # Get the first (and typically only) record for the site
+    record = get_site_record(site_records, selected_country, selected_site)
 
-    if site_data.empty:
+    if record is None:
         st.error(f"❌ No data found for site: {selected_site}")
         return
 
-    # Get the first (and typically only) record for the site
-    record = site_data.iloc[0]
+    # Extract short device ID for image matching, and start fetching the
+    # device images now so they download while the details render
+    short_device_id = extract_device_id(record)
+    prefetch_device_images(short_device_id, pictures_mapping)
 
     # Page header with site name
     st.markdown("---")
@@ -79,12 +85,10 @@ def show_site_dashboard() -> None:
     render_info_section_header(
         "📋 Site Details", level="h4", style_class="site-details-header"
     )
-    render_site_details(filtered_site_info, selected_site)
+    render_site_details(record)
 
     # Add spacing
     st.markdown("---")
 
     # Render device images
-    # Extract short device ID for image matching
-    short_device_id = extract_device_id(record)
     render_device_images(short_device_id, pictures_mapping)
@@ -1,5 +1,15 @@
+import numpy as np
 import pandas as pd
 
+# Columns folded into the composite "_scope" key, outermost first
+SCOPE_COLUMNS = ("Country", "site_name", "device_type")
+
+# Low-cardinality string columns that are filtered on every rerun
+CATEGORICAL_COLUMNS = (*SCOPE_COLUMNS, "status")
+
+# Timestamp columns, parsed explicitly so every CSV parser yields the same dtype
+TIMESTAMP_COLUMNS = ("last_file", "last_recorded")
+
 
 def load_site_info(csv_file, delimiter=","):
     """Load site information from CSV file."""
@@ -9,3 +19,98 @@ def load_site_info(csv_file, delimiter=","):
     site_info["Latitude"] = pd.to_numeric(site_info["Latitude"], errors="coerce")
     site_info["Longitude"] = pd.to_numeric(site_info["Longitude"], errors="coerce")
     return site_info
+
+
+def index_site_records(site_info: pd.DataFrame) -> pd.DataFrame:
+    """Index the first row of every site by country and site name."""
+    records = site_info.dropna(subset=["Country", "Site"])
+    records = records.drop_duplicates(subset=["Country", "Site"])
+    return records.set_index(["Country", "Site"], drop=False)
+
+
+def site_options(site_info: pd.DataFrame) -> tuple[list, dict]:
+    """Get the sorted countries and the sorted sites of each country."""
+    countries = sorted(site_info["Country"].dropna().unique().tolist())
+    sites = site_info.dropna(subset=["Country", "Site"]).groupby("Country")["Site"]
+    sites_by_country = {
+        country: sorted(names.tolist()) for country, names in sites.unique().items()
+    }
+    return countries, sites_by_country
+
+
+def load_device_status(csv_file):
+    """Load device status from CSV file."""
+    # Arrow's multithreaded columnar CSV reader is much faster on large files;
+    # fall back to the default parser for input whose types Arrow rejects
+    try:
+        device_status = pd.read_csv(csv_file, engine="pyarrow")
+    except (ImportError, ValueError):
+        device_status = pd.read_csv(csv_file)
+
+    # Parse timestamps once as naive UTC so filters can compare them directly.
+    # Arrow infers ISO columns as tz-aware timestamps while the default parser
+    # leaves them as strings, so both are normalised to the same dtype here.
+    for column in TIMESTAMP_COLUMNS:
+        if column in device_status.columns:
+            device_status[column] = (
+                pd.to_datetime(device_status[column], errors="coerce", utc=True)
+                .dt.tz_convert(None)
+                .astype("datetime64[ns]")
+            )
+
+    # Store days as clean floats, with infinite values treated as missing
+    if "days_since_last" in device_status.columns:
+        days = pd.to_numeric(device_status["days_since_last"], errors="coerce")
+        days = days.to_numpy(dtype=np.float64, na_value=np.nan)
+        device_status["days_since_last"] = np.where(np.isfinite(days), days, np.nan)
+
+    # Store repeated strings as categoricals so filters compare integer codes
+    for column in CATEGORICAL_COLUMNS:
+        if column in device_status.columns:
+            device_status[column] = device_status[column].astype("category")
+
+    return add_scope_key(device_status)
+
+
+def add_scope_key(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Encode the scope columns into a single composite "_scope" key.
+
+    Each scope column is converted to a categorical and its codes are packed
+    into one int64 column, so filtering on country, site and device type at
+    once only needs a single pass over the data.
+    """
+    scope = np.zeros(len(data), dtype=np.int64)
+    for column in SCOPE_COLUMNS:
+        if column not in data.columns:
+            continue
+        data[column] = data[column].astype("category")
+        # Shift codes by one so missing values (-1) get their own slot
+        codes = data[column].cat.codes.to_numpy().astype(np.int64) + 1
+        scope = scope * (len(data[column].cat.categories) + 1) + codes
+
+    data["_scope"] = scope
+    return data
+
+
+def scope_key_codes(data: pd.DataFrame, selections: dict) -> np.ndarray:
+    """
+    Get every "_scope" value matching the given per-column selections.
+
+    Columns without a selection match all of their values, including missing
+    ones. The result is the Cartesian product of the selected codes.
+    """
+    valid = np.zeros(1, dtype=np.int64)
+    for column in SCOPE_COLUMNS:
+        if column not in data.columns:
+            continue
+        categories = data[column].cat.categories
+        values = selections.get(column)
+        if values:
+            codes = categories.get_indexer(values)
+            codes = codes[codes >= 0].astype(np.int64) + 1
+        else:
+            codes = np.arange(len(categories) + 1, dtype=np.int64)
+        valid = (valid[:, None] * (len(categories) + 1) + codes).ravel()
+
+    return valid